@@ -5,42 +5,73 @@ Provides all user-facing commands: init, validate, generate, promote,
 and AI operations (plan, apply, check, explain).
 """
 
+import os
+import re
+import sys
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.markdown import Markdown
 
 from . import __version__
-from .content_validator import validate_slides
-from .generator import WorkshopGenerator, promote_to_student_pack
-from .loader import SpecLoader
-from .orchestrator import AIOrchestrator
-from .utils import ensure_dir, write_yaml
-from .validator import SpecValidator
+from .utils import cache_dir, ensure_dir, write_yaml
+
+if TYPE_CHECKING:
+    from .loader import SpecLoader
 
 app = typer.Typer(
     name="workshopforge",
     help="Spec-driven workshop generator with AI orchestration",
     add_completion=False,
+    no_args_is_help=True,
 )
 ai_app = typer.Typer(help="AI orchestration commands")
 app.add_typer(ai_app, name="ai")
 
-console = Console()
+# Only the styles used in this module; other bracketed text is kept verbatim
+_MARKUP_TAG = re.compile(r"\[(/?)(red|green|blue|yellow|dim)\]")
+_ANSI_STYLES = {
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "blue": "\x1b[34m",
+    "yellow": "\x1b[33m",
+    "dim": "\x1b[2m",
+}
+_ANSI_RESET = "\x1b[0m"
+
+# Splits comma-separated option values and strips the items in one pass
+_CSV_SEPARATOR = re.compile(r"\s*,\s*")
+
+if sys.stdout.isatty() and "NO_COLOR" not in os.environ:
+
+    def _render_tag(match: "re.Match[str]") -> str:
+        return _ANSI_RESET if match.group(1) else _ANSI_STYLES[match.group(2)]
+
+else:
+
+    def _render_tag(match: "re.Match[str]") -> str:
+        return ""
+
+
+def rprint(*objects: Any, **kwargs: Any) -> None:
+    """Print with markup tags rendered as ANSI colors (or stripped off a terminal)."""
+    print(*(_MARKUP_TAG.sub(_render_tag, str(obj)) for obj in objects), **kwargs)
+
+
+# Printed by --version, both from the app and from main()'s fast path
+_VERSION_LINE = f"workshopforge version {__version__}"
 
 
 def version_callback(value: bool):
     """Print version and exit."""
     if value:
-        rprint(f"workshopforge version {__version__}")
+        print(_VERSION_LINE)
         raise typer.Exit()
 
 
 @app.callback()
-def main(
+def app_callback(
     version: bool = typer.Option(
         None,
         "--version",
@@ -54,109 +85,123 @@ def main(
     pass
 
 
-@app.command()
-def init(
-    path: Path = typer.Argument(..., help="Directory to initialize"),
-    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
-):
+def _exit_on_error(command: Callable[..., Any]) -> Callable[..., Any]:
     """
-    Initialize a new workshop with minimal spec files.
+    Report an unexpected exception from a command as one error line and exit 1.
 
-    Creates spec/ directory with example workshop.yml, modules.yml,
-    profile.yml, project.md, and ai_guidelines.md files.
+    typer.Exit raised by the command itself passes through unchanged.
     """
-    path = path.resolve()
 
-    if path.exists() and not force:
-        if any(path.iterdir()):
-            rprint(
-                f"[red]Error:[/red] Directory {path} exists and is not empty. Use --force to overwrite."
-            )
+    @wraps(command)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return command(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            rprint(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
 
-    ensure_dir(path)
-    spec_dir = ensure_dir(path / "spec")
+    return wrapper
 
-    rprint(f"[blue]Initializing workshop in:[/blue] {path}")
-
-    # Create example workshop.yml
-    workshop_spec = {
-        "id": "example-workshop",
-        "title": "Example Workshop",
-        "version": "1.0.0",
-        "audience": "Developers learning WorkshopForge",
-        "duration": {
-            "groups": 1,
-            "sessions_per_group": 3,
-            "session_minutes": 60,
-        },
-        "policy": {
-            "student_ai_usage": "allowed",
-            "license": "CC-BY-4.0",
-        },
-        "outputs": {
-            "slides": True,
-            "handouts": True,
-        },
-        "branding": {
-            "org": "Your Organization",
-            "theme": "default",
-        },
-    }
-    write_yaml(spec_dir / "workshop.yml", workshop_spec)
-    rprint("  [green]✓[/green] Created spec/workshop.yml")
-
-    # Create example modules.yml
-    modules_spec = {
-        "modules": [
-            {
-                "id": "setup",
-                "title": "Environment Setup",
-                "objective": "Set up development environment and verify installation",
-                "deliverables": ["labs/setup/README.md", "labs/setup/verify.sh"],
-                "duration_minutes": 30,
-            },
-            {
-                "id": "fundamentals",
-                "title": "Core Fundamentals",
-                "objective": "Understand core concepts and implement basic examples",
-                "deliverables": ["labs/fundamentals/README.md", "labs/fundamentals/example.py"],
-                "duration_minutes": 60,
-                "depends_on": ["setup"],
-            },
-            {
-                "id": "advanced",
-                "title": "Advanced Topics",
-                "objective": "Apply advanced patterns and best practices",
-                "deliverables": ["labs/advanced/README.md", "labs/advanced/project/"],
-                "duration_minutes": 90,
-                "depends_on": ["fundamentals"],
-            },
-        ]
-    }
-    write_yaml(spec_dir / "modules.yml", modules_spec)
-    rprint("  [green]✓[/green] Created spec/modules.yml")
-
-    # Create example profile.yml
-    profile_spec = {
-        "domain": "software development",
-        "materials": {
-            "slides_format": "pdf",
-            "deck_engine": "revealjs",
+
+class _BufferedConsole:
+    """
+    Collect output lines and print them with a single rprint call.
+
+    Used as a context manager, pending lines are flushed on exit, including
+    when the command exits early via typer.Exit.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def writeln(self, markup: str = "") -> None:
+        """Queue one line of (markup) text."""
+        self.lines.append(markup)
+
+    def flush(self) -> None:
+        """Print all queued lines and clear the buffer."""
+        if self.lines:
+            rprint("\n".join(self.lines))
+            self.lines.clear()
+
+    def __enter__(self) -> "_BufferedConsole":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+# Starter content written by `init`
+_WORKSHOP_SPEC: Dict[str, Any] = {
+    "id": "example-workshop",
+    "title": "Example Workshop",
+    "version": "1.0.0",
+    "audience": "Developers learning WorkshopForge",
+    "duration": {
+        "groups": 1,
+        "sessions_per_group": 3,
+        "session_minutes": 60,
+    },
+    "policy": {
+        "student_ai_usage": "allowed",
+        "license": "CC-BY-4.0",
+    },
+    "outputs": {
+        "slides": True,
+        "handouts": True,
+    },
+    "branding": {
+        "org": "Your Organization",
+        "theme": "default",
+    },
+}
+
+_MODULES_SPEC: Dict[str, Any] = {
+    "modules": [
+        {
+            "id": "setup",
+            "title": "Environment Setup",
+            "objective": "Set up development environment and verify installation",
+            "deliverables": ["labs/setup/README.md", "labs/setup/verify.sh"],
+            "duration_minutes": 30,
         },
-        "student_pack": {
-            "include_solutions": False,
-            "redactions": ["instructor/**", "reference/**"],
+        {
+            "id": "fundamentals",
+            "title": "Core Fundamentals",
+            "objective": "Understand core concepts and implement basic examples",
+            "deliverables": ["labs/fundamentals/README.md", "labs/fundamentals/example.py"],
+            "duration_minutes": 60,
+            "depends_on": ["setup"],
         },
-        "ci": {
-            "enable_basic_checks": True,
+        {
+            "id": "advanced",
+            "title": "Advanced Topics",
+            "objective": "Apply advanced patterns and best practices",
+            "deliverables": ["labs/advanced/README.md", "labs/advanced/project/"],
+            "duration_minutes": 90,
+            "depends_on": ["fundamentals"],
         },
-    }
-    write_yaml(spec_dir / "profile.yml", profile_spec)
-    rprint("  [green]✓[/green] Created spec/profile.yml")
-
-    # Create project.md
-    project_md = """# Project Context
+    ]
+}
+
+_PROFILE_SPEC: Dict[str, Any] = {
+    "domain": "software development",
+    "materials": {
+        "slides_format": "pdf",
+        "deck_engine": "revealjs",
+    },
+    "student_pack": {
+        "include_solutions": False,
+        "redactions": ["instructor/**", "reference/**"],
+    },
+    "ci": {
+        "enable_basic_checks": True,
+    },
+}
+
+_PROJECT_MD = """# Project Context
 
 This workshop teaches participants how to use WorkshopForge to create
 spec-driven, AI-managed workshops.
@@ -175,11 +220,8 @@ Participants will learn by doing:
 - Progression from simple to complex
 - Real-world scenarios and examples
 """
-    (spec_dir / "project.md").write_text(project_md, encoding="utf-8")
-    rprint("  [green]✓[/green] Created spec/project.md")
 
-    # Create ai_guidelines.md
-    ai_guidelines = """# AI Generation Guidelines
+_AI_GUIDELINES_MD = """# AI Generation Guidelines
 
 ## Style
 - Clear, concise instructions
@@ -196,11 +238,9 @@ Participants will learn by doing:
 - All code must be tested and working
 - Reference spec sources in generated files
 """
-    (spec_dir / "ai_guidelines.md").write_text(ai_guidelines, encoding="utf-8")
-    rprint("  [green]✓[/green] Created spec/ai_guidelines.md")
 
-    # Create README
-    readme = f"""# {workshop_spec['title']}
+# The title is fixed for the starter workshop, so only {name} is left to fill
+_README_TMPL = f"""# {_WORKSHOP_SPEC["title"]}
 
 Workshop initialized with WorkshopForge.
 
@@ -214,16 +254,114 @@ Workshop initialized with WorkshopForge.
 ## Structure
 
 ```
-{path.name}/
+{{name}}/
   spec/          # Workshop specifications (edit these)
   out/           # Generated content (do not edit directly)
 ```
 """
-    (path / "README.md").write_text(readme, encoding="utf-8")
-    rprint("  [green]✓[/green] Created README.md")
 
-    rprint("\n[green]✓ Workshop initialized![/green]")
-    rprint(f"\nNext: cd {path.name} && workshopforge validate")
+
+def _write_init_file(job: Tuple[Path, Any]) -> None:
+    """Write one file created by init: dicts as YAML, strings as text."""
+    file_path, content = job
+    if isinstance(content, str):
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+    else:
+        write_yaml(file_path, content)
+
+
+def _spec_cache_file() -> Optional[Path]:
+    """
+    Get the file caching parsed YAML specs.
+
+    Specs are cached per user, never inside the (shareable) project tree.
+
+    Returns:
+        Path to the cache file, or None if there is no user cache directory
+    """
+    cache_root = cache_dir()
+    return cache_root / "specs.pkl" if cache_root else None
+
+
+@lru_cache(maxsize=8)
+def _cached_loader(spec_dir: str, fingerprint: Tuple[Tuple[str, int, int], ...]) -> "SpecLoader":
+    """Load specs once per (spec_dir, fingerprint) pair."""
+    from .loader import SpecLoader
+
+    loader = SpecLoader(Path(spec_dir), cache_file=_spec_cache_file())
+    loader.load()
+    return loader
+
+
+def _get_loader(spec_dir: Path) -> "SpecLoader":
+    """
+    Get loaded specs, reusing a previous load while the spec files are unchanged.
+
+    Args:
+        spec_dir: Path to spec directory
+
+    Returns:
+        SpecLoader with specs already loaded
+    """
+    with os.scandir(spec_dir) as entries:
+        stats = [(e.name, e.stat()) for e in entries if e.is_file()]
+    fingerprint = tuple(sorted((name, st.st_mtime_ns, st.st_size) for name, st in stats))
+    return _cached_loader(str(spec_dir), fingerprint)
+
+
+@app.command()
+def init(
+    path: Path = typer.Argument(..., help="Directory to initialize"),
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
+):
+    """
+    Initialize a new workshop with minimal spec files.
+
+    Creates spec/ directory with example workshop.yml, modules.yml,
+    profile.yml, project.md, and ai_guidelines.md files.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = Path(os.path.abspath(path))
+
+    if path.exists() and not force:
+        # Probe for a single entry instead of listing the whole directory
+        with os.scandir(path) as entries:
+            non_empty = next(entries, None) is not None
+        if non_empty:
+            rprint(
+                f"[red]Error:[/red] Directory {path} exists and is not empty. Use --force to overwrite."
+            )
+            raise typer.Exit(1)
+
+    # Creates the workshop directory and spec/ in one call
+    spec_dir = ensure_dir(path / "spec")
+
+    # Collect progress lines and print them in one go once all files are written
+    out = _BufferedConsole()
+    out.writeln(f"[blue]Initializing workshop in:[/blue] {path}")
+
+    readme = _README_TMPL.format(name=path.name)
+
+    # The files are independent, so write them concurrently
+    files = [
+        (spec_dir / "workshop.yml", _WORKSHOP_SPEC),
+        (spec_dir / "modules.yml", _MODULES_SPEC),
+        (spec_dir / "profile.yml", _PROFILE_SPEC),
+        (spec_dir / "project.md", _PROJECT_MD),
+        (spec_dir / "ai_guidelines.md", _AI_GUIDELINES_MD),
+        (path / "README.md", readme),
+    ]
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        list(executor.map(_write_init_file, files))
+
+    for file_path, _ in files:
+        out.writeln(f"  [green]✓[/green] Created {file_path.relative_to(path).as_posix()}")
+
+    out.writeln("\n[green]✓ Workshop initialized![/green]")
+    out.writeln(f"\nNext: cd {path.name} && workshopforge validate")
+    out.flush()
 
 
 @app.command()
@@ -233,37 +371,53 @@ def validate(
         "--spec-dir",
         help="Path to spec directory",
     ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Stop at the first invalid spec",
+    ),
 ):
     """
     Validate workshop specifications against JSON schemas.
 
     Checks workshop.yml, modules.yml, and profile.yml for correctness.
+    Specs unchanged since their last successful validation are skipped.
     """
-    spec_dir = spec_dir.resolve()
+    from .validator import SpecValidator
+
+    spec_dir = Path(os.path.abspath(spec_dir))
 
     if not spec_dir.exists():
         rprint(f"[red]Error:[/red] Spec directory not found: {spec_dir}")
         raise typer.Exit(1)
 
-    rprint(f"[blue]Validating specs in:[/blue] {spec_dir}")
-
     # Get schema directory (in package)
     schema_dir = Path(__file__).parent / "schemas"
-    validator = SpecValidator(schema_dir)
-
-    results = validator.validate_directory(spec_dir)
-
-    if not results:
-        rprint("[green]✓ All specs valid![/green]")
-        return
+    cache_root = cache_dir()
+    validator = SpecValidator(
+        schema_dir, cache_file=cache_root / "validated.json" if cache_root else None
+    )
+
+    results = {}
+    for spec_name, errors in validator.iter_validate(spec_dir):
+        results[spec_name] = errors
+        if fail_fast:
+            break
+
+    with _BufferedConsole() as out:
+        out.writeln(f"[blue]Validating specs in:[/blue] {spec_dir}")
+
+        if not results:
+            out.writeln("[green]✓ All specs valid![/green]")
+            return
 
-    # Print errors
-    rprint("[red]✗ Validation errors found:[/red]\n")
-    for spec_name, errors in results.items():
-        rprint(f"[yellow]{spec_name}.yml:[/yellow]")
-        for error in errors:
-            rprint(f"  • {error}")
-        rprint()
+        # Print errors
+        out.writeln("[red]✗ Validation errors found:[/red]\n")
+        for spec_name, errors in results.items():
+            out.writeln(f"[yellow]{spec_name}.yml:[/yellow]")
+            for error in errors:
+                out.writeln(f"  • {error}")
+            out.writeln()
 
     raise typer.Exit(1)
 
@@ -288,8 +442,11 @@ def generate(
     Creates complete workshop structure with labs, instructor materials,
     and CI configuration.
     """
-    spec_dir = spec_dir.resolve()
-    target = target.resolve()
+    from .generator import WorkshopGenerator
+    from .loader import SpecLoader
+
+    spec_dir = Path(os.path.abspath(spec_dir))
+    target = Path(os.path.abspath(target))
 
     if not spec_dir.exists():
         rprint(f"[red]Error:[/red] Spec directory not found: {spec_dir}")
@@ -300,7 +457,7 @@ def generate(
 
     # Load specs
     try:
-        loader = SpecLoader(spec_dir)
+        loader = SpecLoader(spec_dir, cache_file=_spec_cache_file())
         loader.load()
     except Exception as e:
         rprint(f"[red]Error loading specs:[/red] {e}")
@@ -320,6 +477,7 @@ def generate(
 
 
 @app.command()
+@_exit_on_error
 def promote(
     instructor_dir: Path = typer.Argument(..., help="Instructor materials directory"),
     student_dir: Path = typer.Argument(..., help="Student pack output directory"),
@@ -336,36 +494,39 @@ def promote(
     Copies materials while excluding instructor-only content
     based on redaction patterns.
     """
-    instructor_dir = instructor_dir.resolve()
-    student_dir = student_dir.resolve()
+    from .generator import compile_redactions, promote_to_student_pack
+
+    instructor_dir = Path(os.path.abspath(instructor_dir))
+    student_dir = Path(os.path.abspath(student_dir))
 
     if not instructor_dir.exists():
         rprint(f"[red]Error:[/red] Instructor directory not found: {instructor_dir}")
         raise typer.Exit(1)
 
-    rprint("[blue]Promoting to student pack...[/blue]")
-    rprint(f"  Source: {instructor_dir}")
-    rprint(f"  Target: {student_dir}")
+    out = _BufferedConsole()
+    out.writeln("[blue]Promoting to student pack...[/blue]")
+    out.writeln(f"  Source: {instructor_dir}")
+    out.writeln(f"  Target: {student_dir}")
 
     # Parse redactions
     redaction_list = []
     if redactions:
-        redaction_list = [r.strip() for r in redactions.split(",")]
+        redaction_list = _CSV_SEPARATOR.split(redactions.strip())
     else:
         redaction_list = ["instructor/**", "reference/**"]
 
-    rprint(f"  Redactions: {', '.join(redaction_list)}")
+    out.writeln(f"  Redactions: {', '.join(redaction_list)}")
+    # Show the header before the (possibly long) copy starts
+    out.flush()
 
-    try:
-        promote_to_student_pack(instructor_dir, student_dir, redaction_list)
-        rprint("\n[green]✓ Student pack created![/green]")
-        rprint(f"\nOutput: {student_dir}")
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    with out:
+        promote_to_student_pack(instructor_dir, student_dir, compile_redactions(redaction_list))
+        out.writeln("\n[green]✓ Student pack created![/green]")
+        out.writeln(f"\nOutput: {student_dir}")
 
 
 @app.command()
+@_exit_on_error
 def validate_content(
     slides_dir: Path = typer.Argument(
         ..., help="Directory containing slide Markdown files to validate"
@@ -385,7 +546,9 @@ def validate_content(
     - Cognitive Load Theory (Sweller et al., 2019)
     - Mayer's Multimedia Learning principles
     """
-    slides_dir = slides_dir.resolve()
+    from .content_validator import validate_slides
+
+    slides_dir = Path(os.path.abspath(slides_dir))
 
     if not slides_dir.exists():
         rprint(f"[red]Error:[/red] Slides directory not found: {slides_dir}")
@@ -395,36 +558,40 @@ def validate_content(
         rprint(f"[red]Error:[/red] Path is not a directory: {slides_dir}")
         raise typer.Exit(1)
 
-    rprint(f"[blue]Validating slides in:[/blue] {slides_dir}\n")
+    # Nothing to validate: skip the validator entirely
+    with os.scandir(slides_dir) as entries:
+        has_slides = any(entry.name.endswith(".md") for entry in entries)
+    if not has_slides:
+        rprint(f"[yellow]No slide files found in:[/yellow] {slides_dir}")
+        return
+
+    with _BufferedConsole() as out:
+        out.writeln(f"[blue]Validating slides in:[/blue] {slides_dir}\n")
 
-    try:
         violations = validate_slides(slides_dir)
 
         if not violations:
-            rprint("[green]✓ All slides pass cognitive science validation![/green]")
-            rprint("No content violations found.")
+            out.writeln("[green]✓ All slides pass cognitive science validation![/green]")
+            out.writeln("No content violations found.")
             return
 
         # Count total violations
-        total = sum(len(v) for v in violations.values())
-        rprint(f"[red]✗ Found {total} content violation(s)[/red]\n")
+        total = sum(len(v) for _, v in violations)
+        out.writeln(f"[red]✗ Found {total} content violation(s)[/red]\n")
 
         # Print violations by file
-        for slide_file, violations_list in violations.items():
+        for slide_file, violations_list in violations:
             rel_path = slide_file.relative_to(slides_dir)
-            rprint(f"[yellow]{rel_path}:[/yellow]")
+            out.writeln(f"[yellow]{rel_path}:[/yellow]")
             for v in violations_list:
-                rprint(f"  Line {v.line}: [{v.rule}] {v.message}")
-            rprint()
+                out.writeln(f"  Line {v.line}: [{v.rule}] {v.message}")
+            out.writeln()
 
         raise typer.Exit(1)
 
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-
 
 @ai_app.command("plan")
+@_exit_on_error
 def ai_plan(
     goal: str = typer.Argument(..., help="User goal for AI generation"),
     spec_dir: Path = typer.Option(
@@ -445,7 +612,9 @@ def ai_plan(
     Produces a detailed plan with rationale, steps, and policy risks
     without making any changes.
     """
-    spec_dir = spec_dir.resolve()
+    from .orchestrator import AIOrchestrator
+
+    spec_dir = Path(os.path.abspath(spec_dir))
 
     if not spec_dir.exists():
         rprint(f"[red]Error:[/red] Spec directory not found: {spec_dir}")
@@ -454,24 +623,20 @@ def ai_plan(
     rprint(f"[blue]Generating plan with {provider} provider...[/blue]")
     rprint(f"Goal: {goal}\n")
 
-    try:
-        loader = SpecLoader(spec_dir)
-        orchestrator = AIOrchestrator(loader, provider)
-
-        plan = orchestrator.plan(goal)
+    loader = _get_loader(spec_dir)
+    orchestrator = AIOrchestrator(loader, provider)
 
-        # Display plan
-        rprint("[green]Plan generated![/green]\n")
-        rprint(plan["response_text"])
-        rprint(f"\n[dim]Spec hash: {plan['spec_hash']}[/dim]")
-        rprint("[dim]Logged to: ai_logs/[/dim]")
+    plan = orchestrator.plan(goal)
 
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    # Display plan
+    rprint("[green]Plan generated![/green]\n")
+    rprint(plan["response_text"])
+    rprint(f"\n[dim]Spec hash: {plan['spec_hash']}[/dim]")
+    rprint("[dim]Logged to: ai_logs/[/dim]")
 
 
 @ai_app.command("apply")
+@_exit_on_error
 def ai_apply(
     goal: str = typer.Argument(..., help="User goal for AI generation"),
     spec_dir: Path = typer.Option(
@@ -497,7 +662,9 @@ def ai_apply(
     Generates content, runs policy checks, and writes changes
     if compliant (or violations are explicitly allowed).
     """
-    spec_dir = spec_dir.resolve()
+    from .orchestrator import AIOrchestrator
+
+    spec_dir = Path(os.path.abspath(spec_dir))
 
     if not spec_dir.exists():
         rprint(f"[red]Error:[/red] Spec directory not found: {spec_dir}")
@@ -509,29 +676,25 @@ def ai_apply(
     # Parse allowed violations
     allowed = []
     if allow_violations:
-        allowed = [v.strip() for v in allow_violations.split(",")]
+        allowed = _CSV_SEPARATOR.split(allow_violations.strip())
 
-    try:
-        loader = SpecLoader(spec_dir)
-        orchestrator = AIOrchestrator(loader, provider)
+    loader = _get_loader(spec_dir)
+    orchestrator = AIOrchestrator(loader, provider)
 
-        result = orchestrator.apply(goal, allowed)
+    result = orchestrator.apply(goal, allowed)
 
-        if result["success"]:
-            rprint(f"[green]✓ {result['message']}[/green]")
-            rprint(f"\nChanges applied: {len(result['changes'])}")
-        else:
-            rprint(f"[red]✗ {result['message']}[/red]")
-            rprint("\nSee reports/compliance.md for details")
+    if result["success"]:
+        rprint(f"[green]✓ {result['message']}[/green]")
+        rprint(f"\nChanges applied: {len(result['changes'])}")
+    else:
+        rprint(f"[red]✗ {result['message']}[/red]")
+        rprint("\nSee reports/compliance.md for details")
 
-        rprint("\n[dim]Compliance report: reports/compliance.md[/dim]")
-
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    rprint("\n[dim]Compliance report: reports/compliance.md[/dim]")
 
 
 @ai_app.command("check")
+@_exit_on_error
 def ai_check(
     spec_dir: Path = typer.Option(
         Path("spec"),
@@ -550,43 +713,46 @@ def ai_check(
     Validates spec adherence, completeness, and quality standards
     without making changes.
     """
-    spec_dir = spec_dir.resolve()
+    from .orchestrator import AIOrchestrator
+
+    spec_dir = Path(os.path.abspath(spec_dir))
 
     if not spec_dir.exists():
         rprint(f"[red]Error:[/red] Spec directory not found: {spec_dir}")
         raise typer.Exit(1)
 
     if target_dir:
-        target_dir = target_dir.resolve()
+        target_dir = Path(os.path.abspath(target_dir))
         if not target_dir.exists():
             rprint(f"[red]Error:[/red] Target directory not found: {target_dir}")
             raise typer.Exit(1)
 
     rprint("[blue]Running compliance checks...[/blue]\n")
 
-    try:
-        loader = SpecLoader(spec_dir)
-        orchestrator = AIOrchestrator(loader)
+    loader = _get_loader(spec_dir)
+    orchestrator = AIOrchestrator(loader)
 
-        violations = orchestrator.check(target_dir)
+    violations = orchestrator.check(target_dir)
 
-        if not violations:
-            rprint("[green]✓ All checks passed![/green] No violations found.")
-        else:
-            errors = [v for v in violations if v.severity == "error"]
-            warnings = [v for v in violations if v.severity == "warn"]
-
-            rprint("[yellow]Violations found:[/yellow]")
-            rprint(f"  Errors: {len(errors)}")
-            rprint(f"  Warnings: {len(warnings)}")
-            rprint("\nSee reports/compliance.md for details")
+    if not violations:
+        rprint("[green]✓ All checks passed![/green] No violations found.")
+    else:
+        # Count both severities in one pass
+        n_errors = n_warnings = 0
+        for v in violations:
+            if v.severity == "error":
+                n_errors += 1
+            elif v.severity == "warn":
+                n_warnings += 1
 
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+        rprint("[yellow]Violations found:[/yellow]")
+        rprint(f"  Errors: {n_errors}")
+        rprint(f"  Warnings: {n_warnings}")
+        rprint("\nSee reports/compliance.md for details")
 
 
 @ai_app.command("explain")
+@_exit_on_error
 def ai_explain(
     path: str = typer.Argument(..., help="File path to explain"),
     spec_dir: Path = typer.Option(
@@ -601,22 +767,71 @@ def ai_explain(
     Shows traceability from generated files to spec sources
     (modules, deliverables, objectives).
     """
-    spec_dir = spec_dir.resolve()
+    from .orchestrator import AIOrchestrator
+
+    spec_dir = Path(os.path.abspath(spec_dir))
 
     if not spec_dir.exists():
         rprint(f"[red]Error:[/red] Spec directory not found: {spec_dir}")
         raise typer.Exit(1)
 
-    try:
-        loader = SpecLoader(spec_dir)
-        orchestrator = AIOrchestrator(loader)
+    loader = _get_loader(spec_dir)
+    orchestrator = AIOrchestrator(loader)
 
-        explanation = orchestrator.explain(path)
-        rprint(explanation)
+    explanation = orchestrator.explain(path)
+    rprint(explanation)
 
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+
+def _render_usage_guide(prompt: str) -> str:
+    """
+    Render the usage guide Markdown for the current terminal.
+
+    The rendering only depends on the guide text, the terminal width and the
+    color settings, so it is cached in the user cache directory under a key
+    built from those; a cache hit avoids importing Rich's Markdown renderer.
+
+    Args:
+        prompt: Markdown source of the guide
+
+    Returns:
+        Rendered text, including ANSI styles when the terminal supports them
+    """
+    import hashlib
+    import shutil
+
+    width = shutil.get_terminal_size().columns
+    settings = [str(width), str(sys.stdout.isatty())]
+    settings += [
+        os.environ.get(var, "") for var in ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR")
+    ]
+    key = hashlib.sha256("\0".join(settings + [prompt]).encode("utf-8")).hexdigest()
+
+    # A single cache file whose first line is the key of the rendering it holds
+    cache_root = cache_dir()
+    cache_file = cache_root / "usage-prompt.txt" if cache_root else None
+    if cache_file is not None:
+        try:
+            cached_key, _, rendered = cache_file.read_text(encoding="utf-8").partition("\n")
+            if cached_key == key:
+                return rendered
+        except OSError:
+            pass
+
+    from rich.console import Console
+    from rich.markdown import Markdown
+
+    console = Console(width=width)
+    with console.capture() as capture:
+        console.print(Markdown(prompt))
+    rendered = capture.get()
+
+    if cache_file is not None:
+        try:
+            ensure_dir(cache_file.parent)
+            cache_file.write_text(f"{key}\n{rendered}", encoding="utf-8")
+        except OSError:
+            pass
+    return rendered
 
 
 @ai_app.command("usage-prompt")
@@ -657,20 +872,33 @@ def ai_usage_prompt(
     # Read the AI_USAGE_GUIDE.md from forge package
     guide_path = Path(__file__).parent / "AI_USAGE_GUIDE.md"
 
-    if not guide_path.exists():
+    try:
+        prompt = guide_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         rprint("[red]Error:[/red] AI_USAGE_GUIDE.md not found")
         raise typer.Exit(1)
 
-    prompt = guide_path.read_text()
-
     if plain:
         # Output raw markdown for file/clipboard
         print(prompt)
     else:
         # Render as Markdown for beautiful terminal output
-        md = Markdown(prompt)
-        console.print(md)
+        sys.stdout.write(_render_usage_guide(prompt))
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """
+    Console entry point.
+
+    Answers a bare ``--version``/``-v`` probe directly, without building the
+    Typer/Click command tree; everything else is dispatched to the app, which
+    handles the same option itself (e.g. for ``--help`` or direct invocation).
+    """
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(_VERSION_LINE)
+        return
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,29 @@ Validates slides, labs, and other generated content against quality rules
 defined in spec/ai_guidelines.md.
 """
 
+import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import List, Tuple
 
+# Every bullet marker is one character plus a space, so a line's first two
+# characters identify it
+_BULLET_PREFIXES = frozenset({"- ", "* ", "+ ", "✅ ", "❌ "})
+_SPLIT_SUFFIX = re.compile(r"\(\d+/\d+\)$")
 
+# Below this many slide files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+@dataclass(slots=True)
 class ContentViolation:
     """Represents a content quality violation."""
 
-    def __init__(self, file: Path, line: int, rule: str, message: str):
-        self.file = file
-        self.line = line
-        self.rule = rule
-        self.message = message
+    file: Path
+    line: int
+    rule: str
+    message: str
 
     def __str__(self) -> str:
         return f"{self.file}:{self.line} [{self.rule}] {self.message}"
@@ -56,169 +66,164 @@ class SlideValidator:
         if not slide_file.exists():
             return self.violations
 
-        with open(slide_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        self._check_code_blocks(lines, slide_file)
-        self._check_bullet_lists(lines, slide_file)
-        self._check_slide_titles(lines, slide_file)
-        self._check_total_content_per_slide(lines, slide_file)
-
-        return self.violations
+        # All rules are checked in a single pass over the lines. Each rule
+        # collects into its own list so violations keep the per-rule order.
+        code_violations: List[ContentViolation] = []
+        bullet_violations: List[ContentViolation] = []
+        title_violations: List[ContentViolation] = []
+        total_violations: List[ContentViolation] = []
 
-    def _check_code_blocks(self, lines: List[str], file: Path):
-        """Check code block lengths."""
         in_code = False
         code_start = 0
         code_lines = 0
+        slide_start = 0
+        bullet_count = 0
+        content_lines = 0
 
-        for i, line in enumerate(lines, 1):
-            if line.strip().startswith("```"):
-                if not in_code:
-                    # Start of code block
-                    in_code = True
-                    code_start = i
-                    code_lines = 0
-                else:
-                    # End of code block
-                    in_code = False
-                    if code_lines > self.MAX_CODE_LINES:
-                        self.violations.append(
+        # Stream the file; no rule needs to look back at earlier lines
+        with open(slide_file, "r", encoding="utf-8") as f:
+            for i, line in enumerate(f, 1):
+                stripped = line.strip()
+
+                # New slide (separators inside code blocks still count as code lines)
+                if stripped == "---":
+                    if in_code:
+                        code_lines += 1
+                    if bullet_count > self.MAX_BULLETS:
+                        bullet_violations.append(
                             ContentViolation(
-                                file=file,
-                                line=code_start,
-                                rule="code-block-length",
-                                message=f"Code block has {code_lines} lines (max {self.MAX_CODE_LINES}). "
-                                f"Split into multiple slides with (1/2), (2/2) notation.",
+                                file=slide_file,
+                                line=slide_start,
+                                rule="bullet-count",
+                                message=f"Slide has {bullet_count} bullet points (max {self.MAX_BULLETS}). "
+                                f"Split content across multiple slides.",
                             )
                         )
-            elif in_code:
-                code_lines += 1
+                    if content_lines > self.MAX_TOTAL_LINES:
+                        total_violations.append(
+                            ContentViolation(
+                                file=slide_file,
+                                line=slide_start,
+                                rule="total-content",
+                                message=f"Slide has {content_lines} content lines (max {self.MAX_TOTAL_LINES}). "
+                                f"Split into multiple slides - Cognitive Load Theory suggests less is better.",
+                            )
+                        )
+                    bullet_count = 0
+                    content_lines = 0
+                    slide_start = i + 1
+                    continue
+
+                # Code fence: check block length on close; fences are not content
+                if stripped.startswith("```"):
+                    if not in_code:
+                        in_code = True
+                        code_start = i
+                        code_lines = 0
+                    else:
+                        in_code = False
+                        if code_lines > self.MAX_CODE_LINES:
+                            code_violations.append(
+                                ContentViolation(
+                                    file=slide_file,
+                                    line=code_start,
+                                    rule="code-block-length",
+                                    message=f"Code block has {code_lines} lines (max {self.MAX_CODE_LINES}). "
+                                    f"Split into multiple slides with (1/2), (2/2) notation.",
+                                )
+                            )
+                    continue
 
-    def _check_bullet_lists(self, lines: List[str], file: Path):
-        """Check bullet list lengths per slide."""
-        bullet_count = 0
-        slide_start = 0
+                if in_code:
+                    code_lines += 1
 
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
+                # Bullet point
+                if stripped[:2] in _BULLET_PREFIXES:
+                    bullet_count += 1
 
-            # New slide
-            if stripped == "---":
-                if bullet_count > self.MAX_BULLETS:
-                    self.violations.append(
+                # Split notation belongs at the end of the title
+                if line.startswith("##") and "(1/" in line and not _SPLIT_SUFFIX.search(stripped):
+                    title_violations.append(
                         ContentViolation(
-                            file=file,
-                            line=slide_start,
-                            rule="bullet-count",
-                            message=f"Slide has {bullet_count} bullet points (max {self.MAX_BULLETS}). "
-                            f"Split content across multiple slides.",
+                            file=slide_file,
+                            line=i,
+                            rule="split-notation",
+                            message="Split slide notation should be at end of title: '## Title (1/2)'",
                         )
                     )
-                bullet_count = 0
-                slide_start = i + 1
 
-            # Bullet point
-            elif stripped.startswith(("- ", "* ", "+ ", "✅ ", "❌ ")):
-                bullet_count += 1
+                # Count content lines (skip headers, empty lines)
+                if stripped and not stripped.startswith("#"):
+                    content_lines += 1
 
         # Check last slide
         if bullet_count > self.MAX_BULLETS:
-            self.violations.append(
+            bullet_violations.append(
                 ContentViolation(
-                    file=file,
+                    file=slide_file,
                     line=slide_start,
                     rule="bullet-count",
                     message=f"Slide has {bullet_count} bullet points (max {self.MAX_BULLETS})",
                 )
             )
 
-    def _check_slide_titles(self, lines: List[str], file: Path):
-        """Check for proper split slide numbering."""
-        for i, line in enumerate(lines, 1):
-            # Look for titles with potential split indicators
-            if line.startswith("##"):
-                # Check for inconsistent split notation
-                if "(1/" in line and not re.search(r"\(\d+/\d+\)$", line.strip()):
-                    self.violations.append(
-                        ContentViolation(
-                            file=file,
-                            line=i,
-                            rule="split-notation",
-                            message="Split slide notation should be at end of title: '## Title (1/2)'",
-                        )
-                    )
-
-    def _check_total_content_per_slide(self, lines: List[str], file: Path):
-        """Check total content lines per slide (cognitive load)."""
-        slide_start = 0
-        content_lines = 0
-        in_code = False
-
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            # New slide
-            if stripped == "---":
-                if content_lines > self.MAX_TOTAL_LINES:
-                    self.violations.append(
-                        ContentViolation(
-                            file=file,
-                            line=slide_start,
-                            rule="total-content",
-                            message=f"Slide has {content_lines} content lines (max {self.MAX_TOTAL_LINES}). "
-                            f"Split into multiple slides - Cognitive Load Theory suggests less is better.",
-                        )
-                    )
-                content_lines = 0
-                slide_start = i + 1
-                in_code = False
-                continue
+        self.violations = code_violations + bullet_violations + title_violations + total_violations
+        return self.violations
 
-            # Track code blocks
-            if stripped.startswith("```"):
-                in_code = not in_code
-                continue
 
-            # Count content lines (skip headers, empty lines)
-            if stripped and not stripped.startswith("#"):
-                content_lines += 1
+def _validate_one(slide_file: Path) -> Tuple[Path, List[ContentViolation]]:
+    """Validate one slide file (process pool worker)."""
+    return slide_file, SlideValidator().validate_file(slide_file)
 
 
-def validate_slides(slides_dir: Path) -> Dict[Path, List[ContentViolation]]:
+def validate_slides(slides_dir: Path) -> List[Tuple[Path, List[ContentViolation]]]:
     """
     Validate all slides in a directory.
 
+    Large decks are validated in parallel across processes; files are
+    independent.
+
     Args:
         slides_dir: Directory containing slide Markdown files
 
     Returns:
-        Dictionary mapping slide files to their violations
+        List of (slide file, violations) pairs for files with violations,
+        sorted by path
     """
-    validator = SlideValidator()
-    results = {}
+    results: List[Tuple[Path, List[ContentViolation]]] = []
 
-    if not slides_dir.exists():
+    if not slides_dir.is_dir():
         return results
 
-    for slide_file in slides_dir.glob("*.md"):
-        violations = validator.validate_file(slide_file)
+    with os.scandir(slides_dir) as entries:
+        slide_files = sorted(
+            Path(entry.path) for entry in entries if entry.name.endswith(".md") and entry.is_file()
+        )
+    if len(slide_files) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            checked = list(executor.map(_validate_one, slide_files, chunksize=16))
+    else:
+        checked = [_validate_one(slide_file) for slide_file in slide_files]
+
+    for slide_file, violations in checked:
         if violations:
-            results[slide_file] = violations
+            results.append((slide_file, violations))
 
     return results
 
 
-def print_violations(violations_by_file: Dict[Path, List[ContentViolation]]):
+def print_violations(violations_by_file: List[Tuple[Path, List[ContentViolation]]]):
     """Print violations in a readable format."""
     if not violations_by_file:
         print("✓ No content violations found!")
         return
 
-    total = sum(len(v) for v in violations_by_file.values())
+    total = sum(len(v) for _, v in violations_by_file)
     print(f"❌ Found {total} content violations:\n")
 
-    for file, violations in violations_by_file.items():
+    for file, violations in violations_by_file:
         print(f"\n{file}:")
         for violation in violations:
             print(f"  Line {violation.line}: [{violation.rule}] {violation.message}")
@@ -5,13 +5,95 @@ Materializes workshop structure from specifications using Jinja2 templates
 with deterministic output for reproducibility.
 """
 
+import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
 
 from .loader import SpecLoader
-from .utils import ensure_dir, timestamp
+from .utils import cache_dir, ensure_dir, timestamp
+
+
+@lru_cache(maxsize=None)
+def _get_env(template_dir: str) -> Environment:
+    """
+    Get the Jinja2 environment for a template directory, creating it once.
+
+    Sharing the environment lets Jinja's template cache serve repeated
+    get_template() calls across generator instances. Compiled templates are
+    also kept in the user cache directory so later runs skip compilation;
+    Jinja invalidates entries when a template's source changes.
+
+    Args:
+        template_dir: Absolute path to template directory
+
+    Returns:
+        Configured Jinja2 environment
+    """
+    bytecode_cache = None
+    cache_root = cache_dir()
+    if cache_root is not None:
+        try:
+            bytecode_cache = FileSystemBytecodeCache(str(ensure_dir(cache_root / "jinja")))
+        except OSError:
+            pass
+
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=bytecode_cache,
+        # Templates do not change during a run; skip the per-lookup mtime check
+        auto_reload=False,
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    # Add custom filters
+    env.filters["basename"] = _basename
+    env.filters["dirname"] = _dirname
+    return env
+
+
+def _is_plain_path(p: Any) -> bool:
+    """Check whether os.path and pathlib agree on how to split a path."""
+    return (
+        isinstance(p, str)
+        and p not in ("", ".")
+        and "//" not in p
+        and "\\" not in p
+        and "/./" not in p
+        and not p.startswith("./")
+        and not p.endswith(("/", "/."))
+    )
+
+
+def _basename(p: Any) -> str:
+    """Jinja filter: final path component, as Path(p).name."""
+    return os.path.basename(p) if _is_plain_path(p) else Path(p).name
+
+
+def _dirname(p: Any) -> str:
+    """Jinja filter: parent directory, as str(Path(p).parent)."""
+    if _is_plain_path(p):
+        return os.path.dirname(p) or "."
+    return str(Path(p).parent)
+
+
+def _write_rendered(job: Tuple[Path, bytes]) -> None:
+    """Write one rendered template to its output path."""
+    output_path, rendered = job
+    ensure_dir(output_path.parent)
+    output_path.write_bytes(rendered)
 
 
 class WorkshopGenerator:
@@ -37,19 +119,11 @@ class WorkshopGenerator:
             raise FileNotFoundError(f"Template directory not found: {template_dir}")
 
         self.loader = spec_loader
-        self.template_dir = template_dir.resolve()
-
-        # Set up Jinja2 environment
-        self.jinja = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.template_dir = Path(os.path.abspath(template_dir))
 
-        # Add custom filters
-        self.jinja.filters["basename"] = lambda p: Path(p).name
-        self.jinja.filters["dirname"] = lambda p: str(Path(p).parent)
+        self.jinja = _get_env(str(self.template_dir))
+        self._templates: Dict[str, Template] = {}
+        self._pending_writes: List[Tuple[Path, bytes]] = []
 
     def generate(self, target_dir: Path) -> None:
         """
@@ -61,6 +135,8 @@ class WorkshopGenerator:
         Raises:
             RuntimeError: If generation fails
         """
+        # Drop output queued by an earlier call that failed before flushing
+        self._pending_writes = []
         ensure_dir(target_dir)
 
         specs = self.loader.load()
@@ -97,22 +173,50 @@ class WorkshopGenerator:
         if ci_config.get("enable_basic_checks", True):
             self._generate_ci(target_dir, context)
 
+        self._flush_writes()
+
     def _render_template(
         self, template_path: str, output_path: Path, context: Dict[str, Any]
     ) -> None:
         """
-        Render single template to output file.
+        Render single template; the file is written by _flush_writes().
 
         Args:
             template_path: Relative path to template in template_dir
             output_path: Output file path
             context: Template context data
         """
-        template = self.jinja.get_template(template_path)
-        rendered = template.render(**context)
+        template = self._get_template(template_path)
+        # Encode here so the writer threads only do the file I/O
+        rendered = template.render(**context).encode("utf-8")
+        self._pending_writes.append((output_path, rendered))
+
+    def _flush_writes(self) -> None:
+        """Write all rendered files, overlapping the file I/O in a thread pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        writes, self._pending_writes = self._pending_writes, []
+        if not writes:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(4, len(writes))) as executor:
+            list(executor.map(_write_rendered, writes))
+
+    def _get_template(self, template_path: str) -> Template:
+        """
+        Get a template, fetching it from the environment only once per generator.
+
+        Args:
+            template_path: Relative path to template in template_dir
 
-        ensure_dir(output_path.parent)
-        output_path.write_text(rendered, encoding="utf-8")
+        Returns:
+            Loaded template
+        """
+        template = self._templates.get(template_path)
+        if template is None:
+            template = self.jinja.get_template(template_path)
+            self._templates[template_path] = template
+        return template
 
     def _generate_labs(
         self, target_dir: Path, modules: list[Dict[str, Any]], context: Dict[str, Any]
@@ -130,11 +234,8 @@ class WorkshopGenerator:
 
         # Generate per-module lab READMEs
         for module in sorted(modules, key=lambda m: m["id"]):
-            module_dir = labs_dir / module["id"]
-            ensure_dir(module_dir)
-
             module_context = {**context, "module": module}
-            readme_path = module_dir / "README.md"
+            readme_path = labs_dir / module["id"] / "README.md"
             self._render_template("repo/labs/_module_README.md.j2", readme_path, module_context)
 
     def _generate_instructor_materials(self, target_dir: Path, context: Dict[str, Any]) -> None:
@@ -236,20 +337,37 @@ class WorkshopGenerator:
         )
 
 
-def promote_to_student_pack(instructor_dir: Path, student_dir: Path, redactions: list[str]) -> None:
+def compile_redactions(patterns: Iterable[str]) -> list[re.Pattern[str]]:
+    """
+    Compile redaction glob patterns into regular expressions.
+
+    Args:
+        patterns: Glob patterns relative to the instructor directory
+
+    Returns:
+        Compiled patterns matching POSIX-style relative paths
+    """
+    return [re.compile(fnmatch.translate(pattern)) for pattern in patterns]
+
+
+def promote_to_student_pack(
+    instructor_dir: Path,
+    student_dir: Path,
+    redactions: Sequence[Union[str, re.Pattern[str]]],
+) -> None:
     """
     Create student pack from instructor materials by applying redactions.
 
     Args:
         instructor_dir: Source instructor materials
         student_dir: Target student pack directory
-        redactions: List of glob patterns to exclude
+        redactions: Glob patterns to exclude, or patterns precompiled
+            with compile_redactions()
 
     Raises:
         FileNotFoundError: If instructor_dir doesn't exist
     """
     import shutil
-    from fnmatch import fnmatch
 
     if not instructor_dir.exists():
         raise FileNotFoundError(f"Instructor directory not found: {instructor_dir}")
@@ -260,15 +378,25 @@ def promote_to_student_pack(instructor_dir: Path, student_dir: Path, redactions:
     if not redactions:
         redactions = ["instructor/**", "reference/**"]
 
-    # Copy all files except redacted patterns
-    for item in instructor_dir.rglob("*"):
-        if item.is_file():
-            rel_path = item.relative_to(instructor_dir)
-
-            # Check if path matches any redaction pattern
-            should_exclude = any(fnmatch(str(rel_path), pattern) for pattern in redactions)
-
-            if not should_exclude:
-                target_path = student_dir / rel_path
-                ensure_dir(target_path.parent)
-                shutil.copy2(item, target_path)
+    # One alternation of all patterns, so each path is matched in a single call
+    sources = [
+        pattern.pattern if isinstance(pattern, re.Pattern) else fnmatch.translate(pattern)
+        for pattern in redactions
+    ]
+    redacted = re.compile("|".join(f"(?:{source})" for source in sources))
+
+    # Copy all files except redacted patterns. Target directories are created
+    # once, on their first copied file, so fully redacted ones never appear.
+    for dirpath, _, filenames in os.walk(instructor_dir):
+        rel_dir = os.path.relpath(dirpath, instructor_dir)
+        prefix = "" if rel_dir == os.curdir else rel_dir.replace(os.sep, "/") + "/"
+        target_dir: Optional[Path] = None
+
+        for name in filenames:
+            source = os.path.join(dirpath, name)
+            if redacted.match(prefix + name) or not os.path.isfile(source):
+                continue
+
+            if target_dir is None:
+                target_dir = ensure_dir(student_dir / prefix)
+            shutil.copy2(source, target_dir / name)
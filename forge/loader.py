@@ -5,10 +5,16 @@ Discovers and loads workshop specifications from YAML files,
 merging them into a unified data structure.
 """
 
+import os
+import pickle
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .utils import read_yaml
+from .utils import read_yaml, write_cache_file
+
+# Upper bound for entries kept in the parsed-spec cache file
+_PARSE_CACHE_SIZE = 64
 
 
 class SpecLoader:
@@ -19,12 +25,15 @@ class SpecLoader:
     project.md, ai_guidelines.md) and provides unified access to all specs.
     """
 
-    def __init__(self, spec_dir: Path):
+    def __init__(self, spec_dir: Path, cache_file: Optional[Path] = None):
         """
         Initialize spec loader.
 
         Args:
             spec_dir: Path to directory containing spec files
+            cache_file: Optional pickle file holding parsed YAML specs keyed by
+                path, mtime and size; unchanged specs are not re-parsed.
+                Only point this at a user-private location.
 
         Raises:
             FileNotFoundError: If spec_dir doesn't exist
@@ -32,15 +41,25 @@ class SpecLoader:
         if not spec_dir.exists():
             raise FileNotFoundError(f"Spec directory not found: {spec_dir}")
 
-        self.spec_dir = spec_dir.resolve()
+        self.spec_dir = Path(os.path.abspath(spec_dir))
         self._specs: Optional[Dict[str, Any]] = None
+        self.cache_file = cache_file
+        self._parse_cache: Optional[Dict[str, Tuple[Tuple[int, int], Any]]] = None
+        self._parse_cache_dirty = False
+        self._modules_by_id: Optional[Dict[Any, Dict[str, Any]]] = None
+        self._deliverables: Optional[list[str]] = None
+        self._deliverable_owners: Optional[Dict[str, List[int]]] = None
 
     def load(self) -> Dict[str, Any]:
         """
         Load all specifications from the spec directory.
 
+        The Markdown specs (project.md, ai_guidelines.md) are not part of the
+        result; they are read on first access via get_project() and
+        get_ai_guidelines().
+
         Returns:
-            Dictionary with keys: workshop, modules, profile, project, ai_guidelines
+            Dictionary with keys: workshop, modules, profile
 
         Raises:
             FileNotFoundError: If required spec files are missing
@@ -53,8 +72,6 @@ class SpecLoader:
             "workshop": self._load_workshop(),
             "modules": self._load_modules(),
             "profile": self._load_profile(),
-            "project": self._load_project(),
-            "ai_guidelines": self._load_ai_guidelines(),
         }
 
         # Add computed metadata
@@ -63,6 +80,9 @@ class SpecLoader:
             "loaded_files": self._list_loaded_files(),
         }
 
+        if self._parse_cache_dirty:
+            self._save_parse_cache()
+
         self._specs = specs
         return specs
 
@@ -71,14 +91,14 @@ class SpecLoader:
         workshop_file = self.spec_dir / "workshop.yml"
         if not workshop_file.exists():
             raise FileNotFoundError(f"Required spec file missing: {workshop_file}")
-        return read_yaml(workshop_file)
+        return self._read_yaml(workshop_file)
 
     def _load_modules(self) -> Dict[str, Any]:
         """Load modules.yml specification."""
         modules_file = self.spec_dir / "modules.yml"
         if not modules_file.exists():
             raise FileNotFoundError(f"Required spec file missing: {modules_file}")
-        return read_yaml(modules_file)
+        return self._read_yaml(modules_file)
 
     def _load_profile(self) -> Dict[str, Any]:
         """Load profile.yml specification."""
@@ -86,7 +106,62 @@ class SpecLoader:
         if not profile_file.exists():
             # Profile is optional, return defaults
             return {"domain": "general"}
-        return read_yaml(profile_file)
+        return self._read_yaml(profile_file)
+
+    def _read_yaml(self, path: Path) -> Dict[str, Any]:
+        """
+        Read a YAML spec, reusing the cached parse if the file is unchanged.
+
+        Args:
+            path: Path to YAML spec file
+
+        Returns:
+            Parsed YAML data as dictionary
+        """
+        if self.cache_file is None:
+            return read_yaml(path)
+
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cache = self._load_parse_cache()
+        entry = cache.get(str(path))
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        data = read_yaml(path)
+        cache[str(path)] = (stamp, data)
+        self._parse_cache_dirty = True
+        return data
+
+    def _load_parse_cache(self) -> Dict[str, Tuple[Tuple[int, int], Any]]:
+        """Load the parsed-spec cache file (empty if missing or unreadable)."""
+        if self._parse_cache is None:
+            try:
+                with open(self.cache_file, "rb") as f:
+                    self._parse_cache = dict(pickle.load(f))
+            except Exception:
+                self._parse_cache = {}
+        return self._parse_cache
+
+    def _save_parse_cache(self) -> None:
+        """Write the parsed-spec cache file (best-effort)."""
+        write_cache_file(
+            self.cache_file,
+            self._load_parse_cache(),
+            _PARSE_CACHE_SIZE,
+            lambda cache: pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        self._parse_cache_dirty = False
+
+    @cached_property
+    def project(self) -> str:
+        """Content of project.md, read on first access."""
+        return self._load_project()
+
+    @cached_property
+    def ai_guidelines(self) -> str:
+        """Content of ai_guidelines.md, read on first access."""
+        return self._load_ai_guidelines()
 
     def _load_project(self) -> str:
         """Load project.md content."""
@@ -104,17 +179,16 @@ class SpecLoader:
 
     def _list_loaded_files(self) -> list[str]:
         """Get list of actually loaded spec files."""
-        files = []
-        for name in [
+        wanted = {
             "workshop.yml",
             "modules.yml",
             "profile.yml",
             "project.md",
             "ai_guidelines.md",
-        ]:
-            path = self.spec_dir / name
-            if path.exists():
-                files.append(name)
+        }
+        # One directory read instead of a stat per candidate file
+        with os.scandir(self.spec_dir) as entries:
+            files = [entry.name for entry in entries if entry.name in wanted and entry.is_file()]
         return sorted(files)
 
     def get_workshop(self) -> Dict[str, Any]:
@@ -131,11 +205,11 @@ class SpecLoader:
 
     def get_project(self) -> str:
         """Get project description."""
-        return self.load()["project"]
+        return self.project
 
     def get_ai_guidelines(self) -> str:
         """Get AI generation guidelines."""
-        return self.load()["ai_guidelines"]
+        return self.ai_guidelines
 
     def get_module_by_id(self, module_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -147,10 +221,13 @@ class SpecLoader:
         Returns:
             Module spec dict, or None if not found
         """
-        for module in self.get_modules():
-            if module.get("id") == module_id:
-                return module
-        return None
+        if self._modules_by_id is None:
+            # First module wins for duplicate IDs, as with a linear search
+            modules_by_id: Dict[Any, Dict[str, Any]] = {}
+            for module in self.get_modules():
+                modules_by_id.setdefault(module.get("id"), module)
+            self._modules_by_id = modules_by_id
+        return self._modules_by_id.get(module_id)
 
     def get_deliverables(self) -> list[str]:
         """
@@ -159,7 +236,39 @@ class SpecLoader:
         Returns:
             Sorted list of deliverable paths
         """
-        deliverables = []
-        for module in self.get_modules():
-            deliverables.extend(module.get("deliverables", []))
-        return sorted(set(deliverables))
+        if self._deliverables is None:
+            deliverables = set()
+            for module in self.get_modules():
+                deliverables.update(module.get("deliverables", []))
+            self._deliverables = sorted(deliverables)
+        return list(self._deliverables)
+
+    def get_modules_for_deliverable(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Find modules that declare a file as deliverable.
+
+        A module matches if it lists ``file_path`` itself or any deliverable
+        with the same file name.
+
+        Args:
+            file_path: Path of the file to look up
+
+        Returns:
+            Matching module specs in spec order
+        """
+        modules = self.get_modules()
+        if self._deliverable_owners is None:
+            # Full paths and basenames share one index: basenames never contain
+            # a separator, so the two key spaces only overlap where they agree.
+            owners: Dict[str, List[int]] = {}
+            for index, module in enumerate(modules):
+                for deliverable in module.get("deliverables", []):
+                    for key in (deliverable, Path(deliverable).name):
+                        indices = owners.setdefault(key, [])
+                        if not indices or indices[-1] != index:
+                            indices.append(index)
+            self._deliverable_owners = owners
+
+        hits = set(self._deliverable_owners.get(file_path, ()))
+        hits.update(self._deliverable_owners.get(Path(file_path).name, ()))
+        return [modules[index] for index in sorted(hits)]
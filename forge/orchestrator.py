@@ -14,7 +14,7 @@ from .policies import PolicyEngine, PolicyViolation
 from .prelude import PreludeGenerator
 from .providers import get_provider
 from .reporters import ComplianceReporter, format_plan_report
-from .utils import ensure_dir, timestamp, write_json
+from .utils import ensure_dir, read_json, timestamp, write_json
 
 
 class AIOrchestrator:
@@ -122,14 +122,11 @@ class AIOrchestrator:
         # Run policy checks (for now, on current state)
         # In full implementation, would check staged changes
         target_dir = self.loader.spec_dir.parent / "out" / "instructor"
+        # Allowed rules are skipped outright rather than filtered afterwards
         violations = self.policy_engine.check(
-            self.loader, target_dir if target_dir.exists() else None
+            self.loader, target_dir if target_dir.exists() else None, allow_violations
         )
 
-        # Filter allowed violations
-        if allow_violations:
-            violations = self.policy_engine.filter_allowed(violations, allow_violations)
-
         # Check for blocking errors
         has_errors = self.policy_engine.has_errors(violations)
 
@@ -196,14 +193,11 @@ class AIOrchestrator:
         explanations = []
 
         # Check if file is a deliverable
-        modules = self.loader.get_modules()
-        for module in modules:
-            deliverables = module.get("deliverables", [])
-            if file_path in deliverables or str(path.name) in [Path(d).name for d in deliverables]:
-                explanations.append(
-                    f"- Deliverable for module `{module['id']}` (modules.yml#{module['id']})\n"
-                    f"  Objective: {module['objective']}"
-                )
+        for module in self.loader.get_modules_for_deliverable(file_path):
+            explanations.append(
+                f"- Deliverable for module `{module['id']}` (modules.yml#{module['id']})\n"
+                f"  Objective: {module['objective']}"
+            )
 
         # Check if in instructor/reference
         if "instructor" in path.parts:
@@ -287,7 +281,7 @@ class AIOrchestrator:
         # Write log files
         (log_dir / "prelude.txt").write_text(prelude, encoding="utf-8")
         (log_dir / "prompt.json").write_text(
-            json.dumps({"goal": goal, "operation": operation}, indent=2),
+            json.dumps({"goal": goal, "operation": operation}, separators=(",", ":")),
             encoding="utf-8",
         )
         (log_dir / "response.txt").write_text(response, encoding="utf-8")
@@ -329,8 +323,7 @@ class AIOrchestrator:
         if not state_file.exists():
             return None
 
-        with open(state_file, "r") as f:
-            return json.load(f)
+        return read_json(state_file)
 
     def _update_state(self, spec_hash: str, provider: str, last_goal: str) -> None:
         """Update orchestrator state."""
@@ -342,4 +335,5 @@ class AIOrchestrator:
         }
 
         state_file = self.state_dir / "state.json"
-        write_json(state_file, state)
+        # Machine-read only; plan.json stays indented for reviewers
+        write_json(state_file, state, indent=None, separators=(",", ":"))
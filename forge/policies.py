@@ -5,16 +5,160 @@ Enforces workshop quality standards through configurable rules
 that validate structure, completeness, and adherence to specifications.
 """
 
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .content_validator import validate_slides
 from .loader import SpecLoader
 
+# Module IDs should be lowercase-with-dashes
+_MODULE_ID_PATTERN = re.compile(r"^[a-z0-9-]+$")
+
+# Terms the workshop README must mention (lowercase bytes), with their description
+_README_TERMS = (
+    (b"spec", "specifications or spec-driven"),
+    (b"workshopforge", "workshopforge tool"),
+)
+_README_TERM_RE = re.compile(b"|".join(re.escape(term) for term, _ in _README_TERMS), re.IGNORECASE)
+
+# From this many deliverables on, list each parent directory once instead of
+# stat-ing every deliverable
+_BATCH_EXISTS_MIN_DELIVERABLES = 32
+
+# Forbidden patterns in student-facing content, in reporting order
+_FORBIDDEN_PATTERNS = ("TODO", "FIXME", "XXX")
+_FORBIDDEN_RANK = {p.encode(): rank for rank, p in enumerate(_FORBIDDEN_PATTERNS)}
+_FORBIDDEN_RE = re.compile(b"|".join(map(re.escape, _FORBIDDEN_RANK)))
+# Bytes kept from the previous chunk so matches spanning a chunk boundary are seen
+_FORBIDDEN_OVERLAP = max(map(len, _FORBIDDEN_RANK)) - 1
+_SCAN_CHUNK_SIZE = 64 * 1024
+# Below this many lab files, starting threads costs more than it saves
+_PARALLEL_SCAN_MIN_FILES = 16
+
+
+def _existing_target_dir(context: Dict[str, Any]) -> Optional[Path]:
+    """Return the context's target directory if it exists, else None."""
+    target_dir: Optional[Path] = context.get("target_dir")
+    if not target_dir:
+        return None
+    if context.get("target_entries") is not None or target_dir.exists():
+        return target_dir
+    return None
+
+
+def _target_has(context: Dict[str, Any], name: str) -> bool:
+    """
+    Check whether a top-level entry of the target directory exists.
+
+    Uses the listing in the context when available. Symlinks and names not
+    in the listing (e.g. other case on case-insensitive filesystems) are
+    still checked with a stat, as Path.exists() would.
+
+    Args:
+        context: Checking context with an existing target_dir
+        name: Entry name directly below target_dir
+
+    Returns:
+        True if the entry exists
+    """
+    entries = context.get("target_entries")
+    if entries is not None:
+        entry = entries.get(name)
+        if entry is not None and not entry.is_symlink():
+            return True
+    return (context["target_dir"] / name).exists()
+
+
+def _listed_in_parent(path: Path, listings: Dict[str, Optional[frozenset]]) -> bool:
+    """
+    Check whether a path appears in its parent directory's listing.
+
+    Listings are read once per parent and kept in ``listings``. Symlinks are
+    left out of them, so a False result means "unknown" and the caller should
+    fall back to Path.exists().
+
+    Args:
+        path: Path to look up
+        listings: Parent directory -> names of non-symlink entries
+
+    Returns:
+        True if the path is a listed, non-symlink entry
+    """
+    parent = str(path.parent)
+    if parent not in listings:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = frozenset(e.name for e in entries if not e.is_symlink())
+        except OSError:
+            listings[parent] = None
+    names = listings[parent]
+    return names is not None and path.name in names
+
+
+def _iter_markdown_files(directory: str) -> Iterator[str]:
+    """
+    Recursively yield markdown files, in the same order as rglob("*.md").
+
+    Uses the file type cached on each directory entry instead of another
+    stat per path.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        Paths of .md files, prefixed with directory; symlinked directories
+        are not followed
+    """
+    try:
+        scan = os.scandir(directory)
+    except OSError:
+        # Like rglob, treat a non-directory or unreadable directory as empty
+        return
+    subdirs = []
+    with scan as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif os.path.normcase(entry.name).endswith(".md"):
+                yield entry.path
+    for subdir in subdirs:
+        yield from _iter_markdown_files(subdir)
+
+
+def _find_forbidden_pattern(path: str) -> Optional[str]:
+    """
+    Find the forbidden pattern to report for a file.
+
+    The file is read in chunks and scanning stops as soon as the first
+    pattern in reporting order is found.
+
+    Args:
+        path: File to scan
+
+    Returns:
+        First pattern in reporting order that occurs in the file, or None
+    """
+    best = len(_FORBIDDEN_PATTERNS)
+    tail = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_SCAN_CHUNK_SIZE), b""):
+            window = tail + chunk
+            for match in _FORBIDDEN_RE.finditer(window):
+                best = min(best, _FORBIDDEN_RANK[match.group()])
+                if best == 0:
+                    return _FORBIDDEN_PATTERNS[0]
+            tail = window[-_FORBIDDEN_OVERLAP:]
+    return _FORBIDDEN_PATTERNS[best] if best < len(_FORBIDDEN_PATTERNS) else None
+
 
 class PolicyViolation:
     """Represents a single policy violation."""
 
+    # Large slide sets can produce thousands of violations
+    __slots__ = ("rule_id", "severity", "message", "path")
+
     def __init__(
         self,
         rule_id: str,
@@ -51,6 +195,10 @@ class PolicyViolation:
 class PolicyRule:
     """Base class for policy rules."""
 
+    # Rules that only inspect the generated workshop set this; PolicyEngine
+    # skips them when there is no target directory to check
+    requires_target_dir = False
+
     def __init__(self, rule_id: str, severity: str = "error"):
         """
         Initialize rule.
@@ -70,6 +218,8 @@ class PolicyRule:
             context: Checking context with keys:
                 - spec_loader: SpecLoader instance
                 - target_dir: Path to generated workshop (if applicable)
+                - target_entries: Top-level entries of target_dir by name
+                  (optional, set by PolicyEngine)
                 - config: Policy configuration overrides
 
         Returns:
@@ -130,31 +280,42 @@ class ModuleCompletenessRule(PolicyRule):
 class DeliverableExistenceRule(PolicyRule):
     """Verify all declared deliverables exist in generated workshop."""
 
+    requires_target_dir = True
+
     def __init__(self):
         super().__init__("deliverable-existence", severity="error")
 
     def check(self, context: Dict[str, Any]) -> List[PolicyViolation]:
         violations = []
         loader: SpecLoader = context["spec_loader"]
-        target_dir: Optional[Path] = context.get("target_dir")
+        target_dir = _existing_target_dir(context)
 
-        if not target_dir or not target_dir.exists():
+        if target_dir is None:
             # Can't check if target doesn't exist yet
             return violations
 
-        for module in loader.get_modules():
-            for deliverable in module.get("deliverables", []):
-                deliverable_path = target_dir / deliverable
-
-                if not deliverable_path.exists():
-                    violations.append(
-                        PolicyViolation(
-                            self.rule_id,
-                            self.severity,
-                            f"Deliverable not found: {deliverable}",
-                            deliverable,
-                        )
+        deliverables = [
+            d for module in loader.get_modules() for d in module.get("deliverables", [])
+        ]
+        listings: Optional[Dict[str, Optional[frozenset]]] = None
+        if len(deliverables) >= _BATCH_EXISTS_MIN_DELIVERABLES:
+            listings = {}
+
+        for deliverable in deliverables:
+            deliverable_path = target_dir / deliverable
+
+            # Listed entries exist; anything else gets the authoritative stat
+            if listings is not None and _listed_in_parent(deliverable_path, listings):
+                continue
+            if not deliverable_path.exists():
+                violations.append(
+                    PolicyViolation(
+                        self.rule_id,
+                        self.severity,
+                        f"Deliverable not found: {deliverable}",
+                        deliverable,
                     )
+                )
 
         return violations
 
@@ -162,18 +323,20 @@ class DeliverableExistenceRule(PolicyRule):
 class ReadmeRequirementsRule(PolicyRule):
     """Verify README mentions key workshop concepts."""
 
+    requires_target_dir = True
+
     def __init__(self):
         super().__init__("readme-requirements", severity="warn")
 
     def check(self, context: Dict[str, Any]) -> List[PolicyViolation]:
         violations = []
-        target_dir: Optional[Path] = context.get("target_dir")
+        target_dir = _existing_target_dir(context)
 
-        if not target_dir or not target_dir.exists():
+        if target_dir is None:
             return violations
 
         readme_path = target_dir / "README.md"
-        if not readme_path.exists():
+        if not _target_has(context, "README.md"):
             violations.append(
                 PolicyViolation(
                     self.rule_id,
@@ -184,16 +347,18 @@ class ReadmeRequirementsRule(PolicyRule):
             )
             return violations
 
-        readme_content = readme_path.read_text(encoding="utf-8").lower()
+        # The terms are ASCII, so matching bytes case-insensitively skips decoding
+        readme_content = readme_path.read_bytes()
 
-        # Check for key mentions
-        required_terms = [
-            ("spec", "specifications or spec-driven"),
-            ("workshopforge", "workshopforge tool"),
-        ]
+        # Check for key mentions in one pass, stopping once every term was seen
+        found = set()
+        for match in _README_TERM_RE.finditer(readme_content):
+            found.add(match.group().lower())
+            if len(found) == len(_README_TERMS):
+                break
 
-        for term, description in required_terms:
-            if term not in readme_content:
+        for term, description in _README_TERMS:
+            if term not in found:
                 violations.append(
                     PolicyViolation(
                         self.rule_id,
@@ -209,21 +374,23 @@ class ReadmeRequirementsRule(PolicyRule):
 class InstructorSeparationRule(PolicyRule):
     """Verify instructor materials are separated from student content."""
 
+    requires_target_dir = True
+
     def __init__(self):
         super().__init__("instructor-separation", severity="error")
 
     def check(self, context: Dict[str, Any]) -> List[PolicyViolation]:
         violations = []
-        target_dir: Optional[Path] = context.get("target_dir")
+        target_dir = _existing_target_dir(context)
 
-        if not target_dir or not target_dir.exists():
+        if target_dir is None:
             return violations
 
         # Check that instructor/ and reference/ directories exist
         instructor_dir = target_dir / "instructor"
         reference_dir = target_dir / "reference"
 
-        if not instructor_dir.exists():
+        if not _target_has(context, instructor_dir.name):
             violations.append(
                 PolicyViolation(
                     self.rule_id,
@@ -233,7 +400,7 @@ class InstructorSeparationRule(PolicyRule):
                 )
             )
 
-        if not reference_dir.exists():
+        if not _target_has(context, reference_dir.name):
             violations.append(
                 PolicyViolation(
                     self.rule_id,
@@ -249,35 +416,44 @@ class InstructorSeparationRule(PolicyRule):
 class ForbiddenPatternsRule(PolicyRule):
     """Check for forbidden patterns in generated content."""
 
+    requires_target_dir = True
+
     def __init__(self):
         super().__init__("forbidden-patterns", severity="warn")
 
     def check(self, context: Dict[str, Any]) -> List[PolicyViolation]:
         violations = []
-        target_dir: Optional[Path] = context.get("target_dir")
+        target_dir = _existing_target_dir(context)
 
-        if not target_dir or not target_dir.exists():
+        if target_dir is None:
             return violations
 
-        # Forbidden patterns in student-facing content
-        forbidden = ["TODO", "FIXME", "XXX"]
-
         # Check labs directory for forbidden patterns
         labs_dir = target_dir / "labs"
-        if labs_dir.exists():
-            for md_file in labs_dir.rglob("*.md"):
-                content = md_file.read_text(encoding="utf-8")
-                for pattern in forbidden:
-                    if pattern in content:
-                        violations.append(
-                            PolicyViolation(
-                                self.rule_id,
-                                self.severity,
-                                f"Found '{pattern}' in student materials",
-                                str(md_file.relative_to(target_dir)),
-                            )
-                        )
-                        break  # One violation per file is enough
+        if _target_has(context, labs_dir.name):
+            md_files = list(_iter_markdown_files(str(labs_dir)))
+            if len(md_files) >= _PARALLEL_SCAN_MIN_FILES:
+                from concurrent.futures import ThreadPoolExecutor
+
+                # File reads release the GIL; map() keeps the walk order
+                with ThreadPoolExecutor(max_workers=min(8, len(md_files))) as executor:
+                    patterns = list(executor.map(_find_forbidden_pattern, md_files))
+            else:
+                patterns = [_find_forbidden_pattern(md_file) for md_file in md_files]
+
+            # Walked paths all start with labs_dir, so slicing gives the relative path
+            labs_prefix = len(os.path.join(str(labs_dir), ""))
+            for md_file, pattern in zip(md_files, patterns):
+                if pattern is None:
+                    continue
+                violations.append(
+                    PolicyViolation(
+                        self.rule_id,
+                        self.severity,
+                        f"Found '{pattern}' in student materials",
+                        os.path.join(labs_dir.name, md_file[labs_prefix:]),
+                    )
+                )
 
         return violations
 
@@ -289,17 +465,12 @@ class NamingConventionRule(PolicyRule):
         super().__init__("naming-convention", severity="warn")
 
     def check(self, context: Dict[str, Any]) -> List[PolicyViolation]:
-        import re
-
         violations = []
         loader: SpecLoader = context["spec_loader"]
 
-        # Module IDs should be lowercase-with-dashes
-        pattern = re.compile(r"^[a-z0-9-]+$")
-
         for module in loader.get_modules():
             module_id = module.get("id", "")
-            if not pattern.match(module_id):
+            if not _MODULE_ID_PATTERN.match(module_id):
                 violations.append(
                     PolicyViolation(
                         self.rule_id,
@@ -323,14 +494,16 @@ class SlideContentRule(PolicyRule):
     - Mayer's Multimedia Learning principles
     """
 
+    requires_target_dir = True
+
     def __init__(self):
         super().__init__("slide-content-quality", severity="error")
 
     def check(self, context: Dict[str, Any]) -> List[PolicyViolation]:
         violations = []
-        target_dir: Optional[Path] = context.get("target_dir")
+        target_dir = _existing_target_dir(context)
 
-        if not target_dir or not target_dir.exists():
+        if target_dir is None:
             return violations
 
         # Check instructor slides directory
@@ -342,7 +515,7 @@ class SlideContentRule(PolicyRule):
         content_violations = validate_slides(slides_dir)
 
         # Convert ContentViolation to PolicyViolation
-        for slide_file, content_violations_list in content_violations.items():
+        for slide_file, content_violations_list in content_violations:
             for cv in content_violations_list:
                 rel_path = slide_file.relative_to(target_dir)
                 violations.append(
@@ -392,6 +565,7 @@ class PolicyEngine:
         self,
         spec_loader: SpecLoader,
         target_dir: Optional[Path] = None,
+        allowed_rules: Optional[List[str]] = None,
     ) -> List[PolicyViolation]:
         """
         Run all policy checks.
@@ -399,18 +573,37 @@ class PolicyEngine:
         Args:
             spec_loader: Loaded specifications
             target_dir: Generated workshop directory (optional)
+            allowed_rules: Rule IDs to ignore; these rules are not run at all
 
         Returns:
             List of all violations across all rules
         """
+        # List the target once; rules look up top-level entries in it
+        target_entries = None
+        if target_dir:
+            try:
+                with os.scandir(target_dir) as entries:
+                    target_entries = {entry.name: entry for entry in entries}
+            except FileNotFoundError:
+                target_dir = None
+            except OSError:
+                # Not a directory or not readable: rules fall back to stat calls
+                pass
+
         context = {
             "spec_loader": spec_loader,
             "target_dir": target_dir,
+            "target_entries": target_entries,
             "config": self.config,
         }
 
+        skipped = frozenset(allowed_rules or ())
         violations = []
         for rule in self.rules:
+            if target_dir is None and rule.requires_target_dir:
+                continue
+            if rule.rule_id in skipped:
+                continue
             violations.extend(rule.check(context))
 
         return violations
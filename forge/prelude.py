@@ -37,15 +37,21 @@ class PreludeGenerator:
         """
         Generate stable prelude text from specifications.
 
+        The loader's specs do not change once loaded, so the prelude is
+        built once and reused by later calls.
+
         Returns:
             Formatted prelude text for AI context
         """
+        if self._prelude_text:
+            return self._prelude_text
+
         specs = self.loader.load()
         workshop = specs["workshop"]
         modules = self.loader.get_modules()
         profile = specs["profile"]
-        project = specs["project"]
-        ai_guidelines = specs["ai_guidelines"]
+        project = self.loader.get_project()
+        ai_guidelines = self.loader.get_ai_guidelines()
 
         # Build prelude sections
         sections = [
@@ -6,10 +6,42 @@ Requires: anthropic package and ANTHROPIC_API_KEY environment variable.
 """
 
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from .base import AIProvider
 
+# Default parameters for content generation; callers may override any of them
+_DEFAULT_PARAMS: Dict[str, Any] = {
+    "temperature": 0.7,  # Balanced creativity/consistency
+    "max_tokens": 4096,  # Sufficient for workshop content
+    "top_p": 1.0,
+}
+
+# Roles Anthropic accepts in the messages array; the system prompt is passed separately
+_CONVERSATION_ROLES = frozenset(("user", "assistant"))
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> Any:
+    """
+    Get an Anthropic client for an API key, creating it once per process.
+
+    Reusing the client keeps its HTTP connection pool across provider instances.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        anthropic.Anthropic client
+
+    Raises:
+        ImportError: If anthropic package not installed
+    """
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
+
 
 class AnthropicProvider(AIProvider):
     """
@@ -46,9 +78,7 @@ class AnthropicProvider(AIProvider):
 
         # Initialize Anthropic client
         try:
-            import anthropic
-
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self.client = _get_client(api_key)
         except ImportError as e:
             raise ImportError("anthropic package not installed. Install with: uv sync") from e
 
@@ -71,27 +101,25 @@ class AnthropicProvider(AIProvider):
         Raises:
             RuntimeError: If API call fails
         """
-        # Extract system message (Anthropic requires it separate)
-        system_msg = next((m["content"] for m in messages if m["role"] == "system"), "")
-
-        # Extract user messages (Anthropic expects only user/assistant in messages array)
-        user_messages = [
-            {"role": m["role"], "content": m["content"]}
-            for m in messages
-            if m["role"] in ("user", "assistant")
-        ]
-
-        # Set default parameters for content generation
-        params = {
-            "temperature": 0.7,  # Balanced creativity/consistency
-            "max_tokens": 4096,  # Sufficient for workshop content
-            "top_p": 1.0,
-        }
-        params.update(kwargs)  # Allow overrides
+        # Split off the first system message (Anthropic requires it separate) and
+        # keep user/assistant messages, in a single pass
+        system_msg: Optional[str] = None
+        user_messages = []
+        for m in messages:
+            role = m["role"]
+            if role in _CONVERSATION_ROLES:
+                user_messages.append({"role": role, "content": m["content"]})
+            elif role == "system" and system_msg is None:
+                system_msg = m["content"]
+
+        params = {**_DEFAULT_PARAMS, **kwargs}
 
         try:
             response = self.client.messages.create(
-                model=self.model, system=system_msg, messages=user_messages, **params
+                model=self.model,
+                system=system_msg if system_msg is not None else "",
+                messages=user_messages,
+                **params,
             )
 
             # Extract text from response
@@ -7,9 +7,12 @@ and data processing.
 
 import hashlib
 import json
+import math
+import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 def ensure_dir(path: Path) -> Path:
@@ -42,11 +45,18 @@ def read_yaml(path: Path) -> Dict[str, Any]:
     """
     import yaml
 
-    if not path.exists():
-        raise FileNotFoundError(f"YAML file not found: {path}")
+    # Hand raw bytes to the loader: it decodes UTF-8 itself, saving the
+    # intermediate str copy made by a text-mode read. Opening directly saves
+    # a separate existence check.
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"YAML file not found: {path}") from None
 
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # Prefer the libyaml-backed loader; PyYAML only ships it when built with libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader) or {}
 
 
 def write_yaml(path: Path, data: Dict[str, Any]) -> None:
@@ -59,9 +69,18 @@ def write_yaml(path: Path, data: Dict[str, Any]) -> None:
     """
     import yaml
 
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    # Serialize in memory first so the file gets one write instead of one per event
+    text = yaml.dump(
+        data,
+        Dumper=dumper,
+        default_flow_style=False,
+        sort_keys=True,
+        allow_unicode=True,
+    )
     ensure_dir(path.parent)
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=True, allow_unicode=True)
+        f.write(text)
 
 
 def read_json(path: Path) -> Dict[str, Any]:
@@ -76,16 +95,70 @@ def read_json(path: Path) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If JSON is invalid
+        json.JSONDecodeError: If JSON is invalid (orjson raises a subclass)
+    """
+    try:
+        data = path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"JSON file not found: {path}") from None
+
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+# Scalar types orjson encodes exactly like json.dumps (floats are checked separately)
+_ORJSON_EXACT_SCALARS = (str, int, bool, type(None))
+
+
+def _orjson_matches_json(data: Any) -> bool:
     """
-    if not path.exists():
-        raise FileNotFoundError(f"JSON file not found: {path}")
+    Check whether orjson would write the same bytes as json.dumps for data.
 
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    orjson writes exponents and non-finite floats differently (1e16 vs 1e+16,
+    null vs NaN) and serializes types such as datetimes and dataclasses that
+    json rejects, so only plain containers of exact JSON types qualify.
 
+    Args:
+        data: Data to be serialized
 
-def write_json(path: Path, data: Any, indent: int = 2) -> None:
+    Returns:
+        True if both encoders produce identical output
+    """
+    stack = [data]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind in _ORJSON_EXACT_SCALARS:
+            continue
+        if kind is float:
+            if not math.isfinite(item) or "e" in repr(item):
+                return False
+            continue
+        # Shared or circular containers are left to json (which rejects cycles)
+        if id(item) in seen:
+            return False
+        seen.add(id(item))
+        if kind is dict:
+            if not all(type(key) is str for key in item):
+                return False
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        else:
+            return False
+    return True
+
+
+def write_json(
+    path: Path,
+    data: Any,
+    indent: Optional[int] = 2,
+    separators: Optional[Tuple[str, str]] = None,
+) -> None:
     """
     Write data to JSON file with consistent formatting.
 
@@ -93,10 +166,26 @@ def write_json(path: Path, data: Any, indent: int = 2) -> None:
         path: Output file path
         data: Data to serialize
         indent: Indentation level for pretty-printing
+        separators: (item, key) separators as for json.dumps, e.g. (",", ":")
+            for compact output
     """
     ensure_dir(path.parent)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, sort_keys=True, ensure_ascii=False)
+    if indent == 2 and separators is None and _orjson_matches_json(data):
+        # orjson's two-space layout is byte-identical to json.dumps for such data
+        try:
+            import orjson
+
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+            return
+        except (ImportError, TypeError):
+            # Not installed, or data orjson cannot encode (e.g. ints over 64 bits)
+            pass
+
+    # Serialize up front so the file is written in one call, not chunk by chunk
+    path.write_text(
+        json.dumps(data, indent=indent, separators=separators, sort_keys=True, ensure_ascii=False),
+        encoding="utf-8",
+    )
 
 
 def compute_hash(content: str) -> str:
@@ -109,7 +198,8 @@ def compute_hash(content: str) -> str:
     Returns:
         Hexadecimal hash digest (first 16 chars)
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    # A content fingerprint, not a security boundary
+    return hashlib.sha256(content.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
 
 
 def timestamp() -> str:
@@ -132,7 +222,11 @@ def sorted_dict_keys(d: Dict[str, Any]) -> List[str]:
     Returns:
         Sorted list of keys
     """
-    return sorted(d.keys())
+    return sorted(d)
+
+
+_FILENAME_INVALID = re.compile(r"[^a-z0-9-]")
+_FILENAME_DASH_RUN = re.compile(r"-+")
 
 
 def safe_filename(s: str) -> str:
@@ -145,17 +239,61 @@ def safe_filename(s: str) -> str:
     Returns:
         Sanitized filename string
     """
-    import re
-
     # Convert to lowercase and replace spaces/underscores with dashes
     s = s.lower().replace(" ", "-").replace("_", "-")
     # Remove non-alphanumeric except dashes
-    s = re.sub(r"[^a-z0-9-]", "", s)
+    s = _FILENAME_INVALID.sub("", s)
     # Collapse multiple dashes
-    s = re.sub(r"-+", "-", s)
+    s = _FILENAME_DASH_RUN.sub("-", s)
     return s.strip("-")
 
 
+def cache_dir() -> Optional[Path]:
+    """
+    Get the per-user cache directory for WorkshopForge.
+
+    Honours XDG_CACHE_HOME and falls back to ~/.cache. The directory is
+    not created.
+
+    Returns:
+        Path to cache directory, or None if no home directory can be
+        determined (callers then run without caching)
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return Path(base) / "workshopforge"
+
+
+def write_cache_file(
+    path: Path, cache: Dict[str, Any], max_entries: int, encode: Callable[[Any], bytes]
+) -> None:
+    """
+    Trim a cache to its newest entries and write it atomically (best-effort).
+
+    Entries are evicted in insertion order, so the mapping must be kept
+    oldest-first. Write errors are ignored; a missing cache only costs time.
+
+    Args:
+        path: Cache file path
+        cache: Cache mapping, trimmed in place
+        max_entries: Number of entries to keep
+        encode: Serializes the trimmed mapping to bytes
+    """
+    while len(cache) > max_entries:
+        del cache[next(iter(cache))]
+    try:
+        ensure_dir(path.parent)
+        tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(encode(cache))
+        os.replace(tmp_file, path)
+    except OSError:
+        pass
+
+
 def find_spec_dir(start_path: Path) -> Path:
     """
     Find spec directory by walking up from start path.
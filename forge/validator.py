@@ -5,12 +5,49 @@ Validates workshop specifications against JSON schemas to ensure
 correctness and completeness before generation.
 """
 
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from jsonschema import Draft7Validator
 
-from .utils import read_json, read_yaml
+from .utils import read_json, read_yaml, write_cache_file
+
+SCHEMA_FILES = {
+    "workshop": "workshop.schema.json",
+    "modules": "modules.schema.json",
+    "profile": "profile.schema.json",
+}
+
+# Spec types a directory must provide; profile is optional
+_REQUIRED_SPECS = frozenset({"workshop", "modules"})
+
+# Upper bound for entries kept in the validated-specs cache file
+_VALIDATED_CACHE_SIZE = 256
+
+# Compiled validators shared by all SpecValidator instances, keyed by
+# (schema path, mtime_ns) so an edited schema is recompiled automatically.
+_VALIDATOR_CACHE: Dict[Tuple[str, int], Draft7Validator] = {}
+
+
+def _get_validator(schema_path: Path) -> Draft7Validator:
+    """
+    Get compiled validator for a schema file, compiling it on first use.
+
+    Args:
+        schema_path: Path to JSON schema file
+
+    Returns:
+        Draft7Validator for the schema
+    """
+    key = (str(schema_path), schema_path.stat().st_mtime_ns)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = Draft7Validator(read_json(schema_path))
+        _VALIDATOR_CACHE[key] = validator
+    return validator
 
 
 class ValidationError(Exception):
@@ -27,12 +64,14 @@ class SpecValidator:
     against them, providing detailed error messages.
     """
 
-    def __init__(self, schema_dir: Path):
+    def __init__(self, schema_dir: Path, cache_file: Optional[Path] = None):
         """
         Initialize validator with schema directory.
 
         Args:
             schema_dir: Path to directory containing JSON schema files
+            cache_file: Optional JSON file remembering content hashes of specs
+                that passed validation; matching specs are not revalidated
 
         Raises:
             FileNotFoundError: If schema_dir doesn't exist
@@ -40,8 +79,15 @@ class SpecValidator:
         if not schema_dir.exists():
             raise FileNotFoundError(f"Schema directory not found: {schema_dir}")
 
-        self.schema_dir = schema_dir.resolve()
+        self.schema_dir = Path(os.path.abspath(schema_dir))
         self._schemas: Dict[str, Any] = {}
+        self._validators: Dict[str, Draft7Validator] = {}
+        self.cache_file = cache_file
+        self._validated: Optional[Dict[str, str]] = None
+        self._validated_dirty = False
+        # Results of validate_file keyed by (path, mtime_ns, size), so an
+        # unchanged spec checked again by this instance costs one stat call
+        self._file_results: Dict[Tuple[str, int, int], List[str]] = {}
 
     def load_schemas(self) -> None:
         """
@@ -50,17 +96,14 @@ class SpecValidator:
         Raises:
             json.JSONDecodeError: If schema files are invalid JSON
         """
-        schema_files = {
-            "workshop": "workshop.schema.json",
-            "modules": "modules.schema.json",
-            "profile": "profile.schema.json",
-        }
-
-        for name, filename in schema_files.items():
+        for name, filename in SCHEMA_FILES.items():
             schema_path = self.schema_dir / filename
-            if not schema_path.exists():
-                raise FileNotFoundError(f"Required schema missing: {schema_path}")
-            self._schemas[name] = read_json(schema_path)
+            try:
+                validator = _get_validator(schema_path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise FileNotFoundError(f"Required schema missing: {schema_path}") from None
+            self._validators[name] = validator
+            self._schemas[name] = validator.schema
 
     def validate_spec(self, spec_name: str, spec_data: Dict[str, Any]) -> List[str]:
         """
@@ -76,19 +119,18 @@ class SpecValidator:
         Raises:
             KeyError: If schema for spec_name not found
         """
-        if not self._schemas:
+        if not self._validators:
             self.load_schemas()
 
-        if spec_name not in self._schemas:
+        if spec_name not in self._validators:
             raise KeyError(f"No schema found for spec: {spec_name}")
 
-        schema = self._schemas[spec_name]
-        validator = Draft7Validator(schema)
+        validator = self._validators[spec_name]
 
         errors = []
         for error in validator.iter_errors(spec_data):
             # Format error with path and message
-            path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
+            path = ".".join(map(str, error.absolute_path)) if error.absolute_path else "root"
             errors.append(f"[{spec_name}] {path}: {error.message}")
 
         return errors
@@ -97,6 +139,20 @@ class SpecValidator:
         """
         Validate a single spec file.
 
+        Args:
+            spec_file: Path to YAML spec file
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        errors = self._validate_file(spec_file)
+        self._save_validated()
+        return errors
+
+    def _validate_file(self, spec_file: Path) -> List[str]:
+        """
+        Validate a single spec file without writing the cache file.
+
         Args:
             spec_file: Path to YAML spec file
 
@@ -105,15 +161,65 @@ class SpecValidator:
         """
         # Determine spec type from filename
         spec_name = spec_file.stem  # workshop, modules, profile
-        if spec_name not in ["workshop", "modules", "profile"]:
+        if spec_name not in SCHEMA_FILES:
             return [f"Unknown spec type: {spec_name}"]
 
         try:
-            spec_data = read_yaml(spec_file)
-            return self.validate_spec(spec_name, spec_data)
+            st = spec_file.stat()
+            key: Optional[Tuple[str, int, int]] = (
+                os.path.abspath(spec_file),
+                st.st_mtime_ns,
+                st.st_size,
+            )
+        except OSError:
+            # Let the load below report the problem
+            key = None
+        if key in self._file_results:
+            return list(self._file_results[key])
+
+        try:
+            digest = self._content_digest(spec_name, spec_file) if self.cache_file else None
+            if digest is not None and digest in self._load_validated():
+                errors: List[str] = []
+            else:
+                spec_data = read_yaml(spec_file)
+                errors = self.validate_spec(spec_name, spec_data)
+                if digest is not None and not errors:
+                    self._remember_validated(digest)
         except Exception as e:
             return [f"Failed to load {spec_file}: {e}"]
 
+        if key is not None:
+            self._file_results[key] = errors
+        return list(errors)
+
+    def iter_validate(self, spec_dir: Path) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Validate specs in a directory one at a time.
+
+        Specs are checked lazily, so callers can stop after the first
+        invalid spec without validating the rest.
+
+        Args:
+            spec_dir: Path to spec directory
+
+        Yields:
+            Tuples of (spec name, list of errors) for each invalid spec
+        """
+        try:
+            for spec_name in SCHEMA_FILES:
+                spec_file = spec_dir / f"{spec_name}.yml"
+                if spec_file.exists():
+                    errors = self._validate_file(spec_file)
+                    if errors:
+                        yield spec_name, errors
+                else:
+                    if spec_name in _REQUIRED_SPECS:
+                        yield spec_name, [f"Required file missing: {spec_file}"]
+        finally:
+            # Also runs when the caller stops iterating early
+            self._save_validated()
+
     def validate_directory(self, spec_dir: Path) -> Dict[str, List[str]]:
         """
         Validate all specs in a directory.
@@ -124,20 +230,61 @@ class SpecValidator:
         Returns:
             Dictionary mapping spec names to lists of errors
         """
-        results = {}
+        return dict(self.iter_validate(spec_dir))
 
-        for spec_name in ["workshop", "modules", "profile"]:
-            spec_file = spec_dir / f"{spec_name}.yml"
-            if spec_file.exists():
-                errors = self.validate_file(spec_file)
-                if errors:
-                    results[spec_name] = errors
-            else:
-                # Only workshop and modules are required
-                if spec_name in ["workshop", "modules"]:
-                    results[spec_name] = [f"Required file missing: {spec_file}"]
+    def _content_digest(self, spec_name: str, spec_file: Path) -> str:
+        """
+        Hash a spec together with the schema it is validated against.
 
-        return results
+        Args:
+            spec_name: Name of spec (workshop, modules, profile)
+            spec_file: Path to YAML spec file
+
+        Returns:
+            Hex digest identifying this (schema, spec) pair
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update((self.schema_dir / SCHEMA_FILES[spec_name]).read_bytes())
+        digest.update(b"\0")
+        digest.update(spec_file.read_bytes())
+        return digest.hexdigest()
+
+    def _load_validated(self) -> Dict[str, str]:
+        """
+        Load digests of previously validated specs from the cache file.
+
+        Returns:
+            Dictionary mapping digests to "ok" (empty if cache is unreadable)
+        """
+        if self._validated is None:
+            try:
+                self._validated = dict(read_json(self.cache_file))
+            except (OSError, ValueError, TypeError):
+                self._validated = {}
+        return self._validated
+
+    def _remember_validated(self, digest: str) -> None:
+        """
+        Record a digest as valid; it is written out by _save_validated.
+
+        Args:
+            digest: Digest returned by _content_digest
+        """
+        self._load_validated()[digest] = "ok"
+        self._validated_dirty = True
+
+    def _save_validated(self) -> None:
+        """Write recorded digests to the cache file if any were added (best-effort)."""
+        if not self._validated_dirty:
+            return
+        # Unsorted, so the oldest digests stay first and are evicted first
+        write_cache_file(
+            self.cache_file,
+            self._load_validated(),
+            _VALIDATED_CACHE_SIZE,
+            lambda validated: json.dumps(validated).encode("utf-8"),
+        )
+        self._validated_dirty = False
 
     def is_valid(self, spec_dir: Path) -> bool:
         """
@@ -9,17 +9,36 @@ Exit codes:
     1: Error in script execution
 """
 
+import hashlib
 import sys
 from pathlib import Path
-from subprocess import run  # nosec B404 - Using subprocess for git/workshopforge commands (trusted)
+from subprocess import PIPE, Popen, run  # nosec B404 - git/workshopforge commands (trusted)
+from typing import Optional
 
+# Sources that determine `workshopforge ai usage-prompt` output, besides the guide
+GUIDE_SOURCES = ["forge/cli.py", "forge/orchestrator.py", "forge/policies.py"]
+GUIDE_SOURCE_DIRS = ["forge/providers"]
 
-def get_staged_files() -> list[str]:
-    """Get list of staged files from git.
+# Digest of guide + sources from the last check, with its result
+STAMP_PATH = Path(".git") / "workshopforge_guide.hash"
+
+
+def get_staged_files(argv: list[str]) -> list[str]:
+    """Get list of staged files.
+
+    pre-commit passes the staged files matching the hook's ``files`` pattern
+    as arguments, which saves spawning git. Without arguments (manual run),
+    git is asked for the staged files.
+
+    Args:
+        argv: Command line arguments after the script name
 
     Returns:
         List of staged file paths
     """
+    if argv:
+        return argv
+
     result = run(  # nosec B603 B607 - Running git command with fixed args (safe)
         ["git", "diff", "--cached", "--name-only"],
         capture_output=True,
@@ -57,6 +76,59 @@ def check_relevant_changes(staged_files: list[str]) -> bool:
     return False
 
 
+def guide_inputs_digest(guide_path: Path) -> str:
+    """Hash the guide and the sources that produce the generated guide.
+
+    Args:
+        guide_path: Path to the checked-in guide
+
+    Returns:
+        Hex digest over the paths and contents of all inputs
+    """
+    paths = [guide_path] + [Path(p) for p in GUIDE_SOURCES]
+    for source_dir in GUIDE_SOURCE_DIRS:
+        paths.extend(sorted(Path(source_dir).glob("*.py")))
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode("utf-8") + b"\0")
+        try:
+            digest.update(path.read_bytes())
+        except FileNotFoundError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def read_stamp(inputs_digest: str) -> Optional[bool]:
+    """Get the result of the last check if its inputs are unchanged.
+
+    Args:
+        inputs_digest: Digest of the current inputs
+
+    Returns:
+        Whether the guide was up to date, or None if unknown
+    """
+    try:
+        digest, result = STAMP_PATH.read_text().split()
+    except (OSError, ValueError):
+        return None
+    return result == "fresh" if digest == inputs_digest else None
+
+
+def write_stamp(inputs_digest: str, up_to_date: bool) -> None:
+    """Remember the result of a check for its inputs.
+
+    Args:
+        inputs_digest: Digest of the checked inputs
+        up_to_date: Whether the guide was up to date
+    """
+    try:
+        STAMP_PATH.write_text(f"{inputs_digest} {'fresh' if up_to_date else 'outdated'}\n")
+    except OSError:
+        pass  # No .git directory (e.g. a worktree): the next run checks again
+
+
 def validate_guide_freshness() -> bool:
     """Check if AI_USAGE_GUIDE.md needs updating.
 
@@ -74,27 +146,34 @@ def validate_guide_freshness() -> bool:
         print("🔍 Checking AI usage guide freshness...")
         print("=" * 70)
 
-        # Test if the command works
-        result = run(  # nosec B603 B607 - Running controlled command (safe)
-            ["uv", "run", "workshopforge", "ai", "usage-prompt", "--plain"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if result.returncode != 0:
-            print(f"❌ Failed to generate usage guide: {result.stderr}")
-            return False
-
-        current_content = guide_path.read_text()
-        generated_content = result.stdout
-
-        # Ensure newline at end
-        if not generated_content.endswith("\n"):
-            generated_content += "\n"
-
-        # Compare content
-        if current_content == generated_content:
+        # The result only depends on the inputs, so reuse the last one while they are
+        # unchanged instead of starting uv + workshopforge again
+        inputs_digest = guide_inputs_digest(guide_path)
+        up_to_date = read_stamp(inputs_digest)
+        if up_to_date is None:
+            # Read the current guide while the generator process starts up
+            with Popen(  # nosec B603 B607 - Running controlled command (safe)
+                ["uv", "run", "workshopforge", "ai", "usage-prompt", "--plain"],
+                stdout=PIPE,
+                stderr=PIPE,
+                text=True,
+            ) as process:
+                current_content = guide_path.read_text()
+                generated_content, stderr = process.communicate()
+
+            if process.returncode != 0:
+                print(f"❌ Failed to generate usage guide: {stderr}")
+                return False
+
+            # Ensure newline at end
+            if not generated_content.endswith("\n"):
+                generated_content += "\n"
+
+            # Compare content
+            up_to_date = current_content == generated_content
+            write_stamp(inputs_digest, up_to_date)
+
+        if up_to_date:
             print("✅ AI usage guide is up to date")
             print("=" * 70)
             print()
@@ -131,7 +210,7 @@ def main() -> int:
         Exit code (0 = success, 1 = error)
     """
     try:
-        staged_files = get_staged_files()
+        staged_files = get_staged_files(sys.argv[1:])
 
         if not staged_files:
             # No staged files, nothing to check